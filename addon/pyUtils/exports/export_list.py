@@ -1,45 +1,56 @@
 """Module for defining files defining symbols to export from thermopack"""
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+import hashlib
+import os
 import sys
-from shutil import move
 from pathlib import Path
 
 
-def get_export_statement(platform, compiler, export_info):
-    export_statement = ""
+@lru_cache(maxsize=1)
+def _now_iso():
+    """Time stamp shared by all files written in one run"""
+    return datetime.today().isoformat()
 
-    if export_info["module"] is None:
-        if platform == MACOS:
-            export_statement += "_"
 
-        export_statement += export_info["method"]
+@lru_cache(maxsize=None)
+def get_export_formatter(platform, compiler):
+    """Return a function mangling (method, module, isBindC) for one target"""
+    if compiler == GNU:
+        in_module = lambda method, module: f"__{module}_MOD_{method}"
+    elif compiler == IFORT:
+        in_module = lambda method, module: f"{module}_mp_{method}_"
+    elif compiler == PGF90:
+        in_module = lambda method, module: f"{module}_{method}_"
+    elif compiler == GENERIC:
+        in_module = lambda method, module: f"*{method}*"
 
-        if not export_info["isBindC"]:
-            export_statement += "_"
-    else:
-        if compiler == GNU:
-            export_statement = "__" + export_info["module"] \
-                + "_MOD_" + export_info["method"]
-        elif compiler == IFORT:
-            export_statement = export_info["module"] + "_mp_" \
-                + export_info["method"] + "_"
-        elif compiler == PGF90:
-            export_statement = export_info["module"] + "_" \
-                + export_info["method"] + "_"
-        elif compiler == GENERIC:
-            export_statement = "*" + export_info["method"] + "*"
+    prefix = "_" if platform == MACOS else ""
+
+    def formatter(method, module, isBindC):
+        if module is None:
+            if isBindC:
+                return f"{prefix}{method}"
+            return f"{prefix}{method}_"
+        return in_module(method, module)
+
+    return formatter
 
-    return export_statement
+
+def get_export_statement(platform, compiler, method, module, isBindC):
+    return get_export_formatter(platform, compiler)(method, module, isBindC)
 
 
 def get_export_header(linker):
-    now = datetime.today().isoformat()
+    now = _now_iso()
     if linker == LD_MSVC:
         comment_symbol = ";"
     else:
         comment_symbol = "#"
-    header = comment_symbol + " File generated by thermopack/addon/pyUtils/exports/export_list.py\n"
-    header += comment_symbol + " Time stamp: " + now
+    header = (f"{comment_symbol} File generated by "
+              f"thermopack/addon/pyUtils/exports/export_list.py\n"
+              f"{comment_symbol} Time stamp: {now}")
     if linker == LD_GCC:
         header += "\nlibthermopack {\n# Explicit list of symbols to be exported\n  global:"
     elif linker == LD_CLANG:
@@ -50,300 +61,371 @@ def get_export_header(linker):
 
 
 def get_export_footer(linker):
-    footer = None
     if linker == LD_GCC:
-        footer = "\n  local: *;      # hide everything else\n};"
-    return footer
+        return "\n  local: *;      # hide everything else\n};"
+    return ""
 
 
-def write_def_file(compiler, linker, platform, filename):
-    lines = []
-    header = get_export_header(linker)
-    lines.append(header)
-    for export in exports:
-        export_statement = get_export_statement(platform, compiler, export)
-        if linker == LD_GCC:
-            lines.append("\t" + export_statement + ";")
-        elif linker in (LD_CLANG, LD_MSVC):
-            lines.append("\t" + export_statement)
+@lru_cache(maxsize=None)
+def _header_bytes(linker):
+    return get_export_header(linker).encode("utf-8")
+
+
+@lru_cache(maxsize=None)
+def _footer_bytes(linker):
     footer = get_export_footer(linker)
-    if footer is not None:
-        lines.append(footer)
-
-    with open(filename, "w", encoding="utf-8") as f:
-        for line in lines:
-            f.write(line)
-            f.write("\n")
-
-
-def append_export(method, module=None, isBindC=False):
-    """Append export symbol"""
-    exports.append({'method': method, 'module': module, 'isBindC': isBindC})
-
-
-exports = []
-
-append_export("thermopack_init_c", isBindC=True)
-append_export("thermopack_pressure_c", isBindC=True)
-append_export("thermopack_specific_volume_c", isBindC=True)
-append_export("thermopack_tpflash_c", isBindC=True)
-append_export("thermopack_uvflash_c", isBindC=True)
-append_export("thermopack_hpflash_c", isBindC=True)
-append_export("thermopack_spflash_c", isBindC=True)
-append_export("thermopack_bubt_c", isBindC=True)
-append_export("thermopack_bubp_c", isBindC=True)
-append_export("thermopack_dewt_c", isBindC=True)
-append_export("thermopack_dewp_c", isBindC=True)
-append_export("thermopack_zfac_c", isBindC=True)
-append_export("thermopack_enthalpy_c", isBindC=True)
-append_export("thermopack_entropy_c", isBindC=True)
-append_export("thermopack_wilsonk_c", isBindC=True)
-append_export("thermopack_wilsonki_c", isBindC=True)
-append_export("thermopack_getcriticalparam_c", isBindC=True)
-append_export("thermopack_moleweight_c", isBindC=True)
-append_export("thermopack_compmoleweight_c", isBindC=True)
-append_export("thermopack_puresat_t_c", isBindC=True)
-append_export("thermopack_entropy_tv_c", isBindC=True)
-append_export("thermopack_twophase_dhdt_c", isBindC=True)
-append_export("thermopack_guess_phase_c", isBindC=True)
-append_export("thermopack_thermo_c", isBindC=True)
-append_export("get_phase_flags_c", isBindC=True)
-
-append_export("thermopack_getkij")
-append_export("thermopack_setkijandji")
-append_export("thermopack_getlij")
-append_export("thermopack_setlijandji")
-append_export("thermopack_gethvparam")
-append_export("thermopack_sethvparam")
-append_export("thermopack_getwsparam")
-append_export("thermopack_setwsparam")
-append_export("thermopack_get_volume_shift_parameters")
-append_export("thermopack_set_volume_shift_parameters")
-
-append_export("thermopack_set_alpha_corr")
-append_export("thermopack_set_beta_corr")
-
-append_export("get_bp_term", "binaryplot")
-append_export("vllebinaryxy", "binaryplot")
-append_export("global_binary_plot", "binaryplot")
-append_export("threephaseline", "binaryplot")
-
-append_export("comp_index_active", "compdata")
-append_export("comp_name_active", "compdata")
-append_export("comp_structure", "compdata")
-append_export("get_ideal_cp_correlation", "compdata")
-append_export("set_ideal_cp_correlation", "compdata")
-
-append_export("calccriticaltv", "critical")
-
-append_export("get_energy_constants", "cubic_eos")
-append_export("get_covolumes", "cubic_eos")
-
-append_export("specificvolume", "eos")
-append_export("zfac", "eos")
-append_export("thermo", "eos")
-append_export("entropy", "eos")
-append_export("enthalpy", "eos")
-append_export("compmoleweight", "eos")
-append_export("moleweight", "eos")
-append_export("getcriticalparam", "eos")
-append_export("ideal_enthalpy_single", "eos")
-append_export("ideal_entropy_single", "eos")
-
-append_export("init_thermo", "eoslibinit")
-append_export("init_cubic", "eoslibinit")
-append_export("init_cubic_pseudo", "eoslibinit")
-append_export("init_cpa", "eoslibinit")
-append_export("init_pcsaft", "eoslibinit")
-append_export("init_saftvrmie", "eoslibinit")
-append_export("init_quantum_cubic", "eoslibinit")
-append_export("init_tcpr", "eoslibinit")
-append_export("init_quantum_saftvrmie", "eoslibinit")
-append_export("init_extcsp", "eoslibinit")
-append_export("init_lee_kesler", "eoslibinit")
-append_export("init_multiparameter", "eoslibinit")
-append_export("init_pets", "eoslibinit")
-append_export("init_volume_translation", "eoslibinit")
-append_export("redefine_critical_parameters", "eoslibinit")
-append_export("init_lj", "eoslibinit")
-append_export("init_ljs", "eoslibinit")
-append_export("init_ideal_eos", "eoslibinit")
-
-append_export("internal_energy_tv", "eostv")
-append_export("entropy_tv", "eostv")
-append_export("pressure", "eostv")
-append_export("thermo_tv", "eostv")
-append_export("enthalpy_tv", "eostv")
-append_export("free_energy_tv", "eostv")
-append_export("chemical_potential_tv", "eostv")
-append_export("virial_coefficients", "eostv")
-append_export("secondvirialcoeffmatrix", "eostv")
-append_export("binarythirdvirialcoeffmatrix", "eostv")
-append_export("entropy_tvp", "eostv")
-append_export("thermo_tvp", "eostv")
-append_export("enthalpy_tvp", "eostv")
-
-append_export("fmt_energy_density", "fundamental_measure_theory")
-
-append_export("calc_bmcsl_gij_fmt", "hardsphere_bmcsl")
-
-append_export("set_standard_entropy", "ideal")
-append_export("get_standard_entropy", "ideal")
-append_export("set_enthalpy_of_formation", "ideal")
-append_export("get_enthalpy_of_formation", "ideal")
-
-append_export("isobar", "isolines")
-append_export("isotherm", "isolines")
-append_export("isenthalp", "isolines")
-append_export("isentrope", "isolines")
-
-append_export("map_jt_inversion", "joule_thompson_inversion")
-
-append_export("ljs_bh_model_control", "lj_splined")
-append_export("ljs_bh_get_pure_params", "lj_splined")
-append_export("ljs_bh_set_pure_params", "lj_splined")
-append_export("calc_ai_reduced_ljs_ex", "lj_splined")
-append_export("ljs_bh_get_bh_diameter_div_sigma", "lj_splined")
-append_export("calc_ljs_wca_ai_tr", "lj_splined")
-append_export("ljs_uv_model_control", "lj_splined")
-append_export("ljs_wca_model_control", "lj_splined")
-append_export("ljs_wca_set_pure_params", "lj_splined")
-append_export("ljs_wca_get_pure_params", "lj_splined")
-
-append_export("solve_mu_t", "mut_solver")
-append_export("solve_lnf_t", "mut_solver")
-append_export("map_meta_isotherm", "mut_solver")
-
-append_export("fres_multipol", "multipol")
-append_export("multipol_model_control", "multipol")
-
-append_export("lng_ii_pc_saft_tvn", "pc_saft_nonassoc")
-
-append_export("setphtolerance", "ph_solver")
-append_export("twophasephflash", "ph_solver")
-
-append_export("twophasepsflash", "ps_solver")
-
-append_export("get_saftvrmie_eps_kij", "saftvrmie_containers")
-append_export("set_saftvrmie_eps_kij", "saftvrmie_containers")
-append_export("get_saftvrmie_sigma_lij", "saftvrmie_containers")
-append_export("set_saftvrmie_sigma_lij", "saftvrmie_containers")
-append_export("get_saftvrmie_lr_gammaij", "saftvrmie_containers")
-append_export("set_saftvrmie_lr_gammaij", "saftvrmie_containers")
-append_export("get_saftvrmie_pure_fluid_param", "saftvrmie_containers")
-append_export("set_saftvrmie_pure_fluid_param", "saftvrmie_containers")
-append_export("get_feynman_hibbs_order", "saftvrmie_containers")
-append_export("set_saftvrmie_mass", "saftvrmie_containers")
-append_export("set_saftvrmie_pure_fluid_deboer", "saftvrmie_containers")
-
-append_export("model_control_hs", "saftvrmie_interface")
-append_export("model_control_a1", "saftvrmie_interface")
-append_export("model_control_a2", "saftvrmie_interface")
-append_export("model_control_a3", "saftvrmie_interface")
-append_export("model_control_chain", "saftvrmie_interface")
-append_export("hard_sphere_reference", "saftvrmie_interface")
-append_export("set_temperature_cache_flag", "saftvrmie_interface")
-append_export("calc_saftvrmie_term", "saftvrmie_interface")
-
-
-append_export("printbinarymixturereportsaft", "saft_interface")
-append_export("print_cpa_report", "saft_interface")
-append_export("cpa_get_kij", "saft_interface")
-append_export("cpa_set_kij", "saft_interface")
-append_export("cpa_set_pure_params", "saft_interface")
-append_export("cpa_get_pure_params", "saft_interface")
-append_export("cpa_set_kij", "saft_interface")
-append_export("pc_saft_get_kij", "saft_interface")
-append_export("pc_saft_set_kij_asym", "saft_interface")
-append_export("calc_saft_dispersion", "saft_interface")
-append_export("calc_saft_chain", "saft_interface")
-append_export("calc_hard_sphere_diameter", "saft_interface")
-append_export("calc_hard_sphere_diameter_ij", "saft_interface")
-append_export("pc_saft_get_pure_params", "saft_interface")
-append_export("pc_saft_set_pure_params", "saft_interface")
-append_export("de_broglie_wavelength", "saft_interface")
-append_export("potential", "saft_interface")
-append_export("adjust_mass_to_specified_de_boer_parameter", "saft_interface")
-append_export("de_boer_parameter", "saft_interface")
-append_export("calc_soft_repulsion", "saft_interface")
-append_export("pets_get_pure_params", "saft_interface")
-append_export("pets_set_pure_params", "saft_interface")
-append_export("truncation_corrections", "saft_interface")
-append_export("calc_saft_hard_sphere", "saft_interface")
-append_export("test_fmt_compatibility", "saft_interface")
-append_export("setcpaformulation", "saft_interface")
-append_export("get_n_assoc_sites", "saft_interface")
-append_export("calc_assoc_phi", "saft_interface")
-append_export("calc_saft_dispersion", "saft_interface")
-append_export("calc_hard_sphere_diameter", "saft_interface")
-append_export("pc_saft_get_pure_params", "saft_interface")
-append_export("pc_saft_set_pure_params", "saft_interface")
-append_export("de_broglie_wavelength", "saft_interface")
-append_export("sigma_ij", "saft_interface")
-append_export("epsilon_ij", "saft_interface")
-append_export("sigma_eff_ij", "saft_interface")
-append_export("epsilon_eff_ij", "saft_interface")
-append_export("alpha", "saft_interface")
-append_export("getactiveassocparams", "saft_interface")
-append_export("setactiveassocparams", "saft_interface")
-
-append_export("map_stability_limit", "spinodal")
-append_export("initial_stab_limit_point", "spinodal")
-append_export("map_meta_isentrope", "spinodal")
-append_export("tv_meta_ps", "spinodal")
-
-append_export("safe_bubt", "saturation")
-append_export("safe_bubp", "saturation")
-append_export("safe_dewt", "saturation")
-append_export("safe_dewp", "saturation")
-
-append_export("envelopeplot", "saturation_curve")
-append_export("envelope_isentrope_cross", "saturation_curve")
-append_export("pure_fluid_saturation_wrapper", "saturation_curve")
-
-append_export("locate_saturation_property", "saturation_point_locators")
-append_export("property_index_from_string", "saturation_point_locators")
-append_export("sat_points_based_on_prop", "saturation_point_locators")
-
-append_export("solid_init", "solideos")
-append_export("solid_specificvolume", "solideos")
-append_export("solid_enthalpy", "solideos")
-append_export("solid_entropy", "solideos")
-
-append_export("solidenvelopeplot", "solid_saturation")
-append_export("melting_pressure_correlation", "solid_saturation")
-append_export("sublimation_pressure_correlation", "solid_saturation")
-
-append_export("sound_velocity_2ph", "speed_of_sound")
-append_export("speed_of_sound_tv", "speed_of_sound")
-
-append_export("guessphase", "thermo_utils")
-
-append_export("get_true", "thermopack_constants")
-
-append_export("set_numerical_robustness_level", "thermopack_var")
-append_export("get_numerical_robustness_level", "thermopack_var")
-append_export("get_rgas", "thermopack_var")
-append_export("set_tmin", "thermopack_var")
-append_export("get_tmin", "thermopack_var")
-append_export("set_tmax", "thermopack_var")
-append_export("get_tmax", "thermopack_var")
-append_export("set_pmin", "thermopack_var")
-append_export("get_pmin", "thermopack_var")
-append_export("set_pmax", "thermopack_var")
-append_export("get_pmax", "thermopack_var")
-append_export("set_pmin", "thermopack_var")
-append_export("get_pmin", "thermopack_var")
-append_export("add_eos", "thermopack_var")
-append_export("delete_eos", "thermopack_var")
-append_export("activate_model", "thermopack_var")
-append_export("get_eos_identification", "thermopack_var")
-
-append_export("twophasetpflash", "tp_solver")
-
-append_export("twophasesvflash", "sv_solver")
-
-append_export("twophaseuvflash", "uv_solver")
+    return f"\n{footer}".encode("utf-8") if footer else b""
+
+
+def _content_unchanged(filename, content):
+    """Compare content to the existing file, ignoring the time stamp line"""
+    if not os.path.exists(filename):
+        return False
+    with open(filename, "rb") as f:
+        old_content = f.read()
+
+    def digest(data):
+        stripped = b"\n".join(line for line in data.splitlines()
+                              if b"Time stamp" not in line)
+        return hashlib.sha1(stripped).digest()
+
+    return digest(old_content) == digest(content)
+
+
+def write_all(configs):
+    """Write several def files in one pass over the export list
+
+    configs is a list of (compiler, linker, platform, filename) tuples,
+    one per output file.
+    """
+    outputs = []
+    for compiler, linker, platform, filename in configs:
+        lines = []
+        fmt = get_export_formatter(platform, compiler)
+        suffix = ";" if linker == LD_GCC else ""
+        outputs.append((linker, fmt, suffix, set(), lines, filename))
+
+    for method, module, isBindC in get_exports():
+        for linker, fmt, suffix, seen, lines, _ in outputs:
+            export_statement = fmt(method, module, isBindC)
+            if export_statement in seen:
+                continue
+            seen.add(export_statement)
+            lines.append(f"\t{export_statement}{suffix}")
+
+    if len(outputs) == 1:
+        linker, _, _, _, lines, filename = outputs[0]
+        _write_output(linker, lines, filename)
+    else:
+        # The writes are independent and release the GIL, so overlap them
+        with ThreadPoolExecutor(max_workers=len(outputs)) as executor:
+            futures = [executor.submit(_write_output, linker, lines, filename)
+                       for linker, _, _, _, lines, filename in outputs]
+            for future in futures:
+                future.result()
+
+
+def _write_output(linker, lines, filename):
+    body = "\n".join(lines).encode("utf-8")
+    content = _header_bytes(linker) + b"\n" + body \
+        + _footer_bytes(linker) + b"\n"
+    if _content_unchanged(filename, content):
+        # Avoid touching the file, and thereby triggering a re-link,
+        # when only the time stamp would change
+        return
+    with open(filename, "wb") as f:
+        f.write(content)
+
+
+def write_def_file(compiler, linker, platform, filename):
+    write_all([(compiler, linker, platform, filename)])
+
+
+def append_export(method, module=None, isBindC=False, priority=0):
+    """Append export symbol not already part of the static EXPORTS table
+
+    Lower priority numbers are placed earlier in the generated scripts.
+    """
+    _extra_exports.append((method, module, isBindC, priority))
+
+
+def get_exports():
+    """Return all export symbols as (method, module, isBindC) tuples
+
+    Entries are ordered by (priority, module, method), so hot symbols
+    can be placed early in the linker scripts for better symbol-table
+    locality once profile-derived priorities are assigned.
+    """
+    return _sorted_exports(tuple(_extra_exports))
+
+
+@lru_cache(maxsize=1)
+def _sorted_exports(extra_exports):
+    entries = [entry + (0,) for entry in EXPORTS]
+    entries.extend(extra_exports)
+    entries.sort(key=lambda entry: (entry[3], entry[1] or "", entry[0]))
+    return tuple((method, module, isBindC)
+                 for method, module, isBindC, _ in entries)
+
+
+_extra_exports = []
+
+# Symbols to export, as (method, module, isBindC) entries
+EXPORTS = (
+    ("thermopack_init_c", None, True),
+    ("thermopack_pressure_c", None, True),
+    ("thermopack_specific_volume_c", None, True),
+    ("thermopack_tpflash_c", None, True),
+    ("thermopack_uvflash_c", None, True),
+    ("thermopack_hpflash_c", None, True),
+    ("thermopack_spflash_c", None, True),
+    ("thermopack_bubt_c", None, True),
+    ("thermopack_bubp_c", None, True),
+    ("thermopack_dewt_c", None, True),
+    ("thermopack_dewp_c", None, True),
+    ("thermopack_zfac_c", None, True),
+    ("thermopack_enthalpy_c", None, True),
+    ("thermopack_entropy_c", None, True),
+    ("thermopack_wilsonk_c", None, True),
+    ("thermopack_wilsonki_c", None, True),
+    ("thermopack_getcriticalparam_c", None, True),
+    ("thermopack_moleweight_c", None, True),
+    ("thermopack_compmoleweight_c", None, True),
+    ("thermopack_puresat_t_c", None, True),
+    ("thermopack_entropy_tv_c", None, True),
+    ("thermopack_twophase_dhdt_c", None, True),
+    ("thermopack_guess_phase_c", None, True),
+    ("thermopack_thermo_c", None, True),
+    ("get_phase_flags_c", None, True),
+
+    ("thermopack_getkij", None, False),
+    ("thermopack_setkijandji", None, False),
+    ("thermopack_getlij", None, False),
+    ("thermopack_setlijandji", None, False),
+    ("thermopack_gethvparam", None, False),
+    ("thermopack_sethvparam", None, False),
+    ("thermopack_getwsparam", None, False),
+    ("thermopack_setwsparam", None, False),
+    ("thermopack_get_volume_shift_parameters", None, False),
+    ("thermopack_set_volume_shift_parameters", None, False),
+
+    ("thermopack_set_alpha_corr", None, False),
+    ("thermopack_set_beta_corr", None, False),
+
+    ("get_bp_term", "binaryplot", False),
+    ("vllebinaryxy", "binaryplot", False),
+    ("global_binary_plot", "binaryplot", False),
+    ("threephaseline", "binaryplot", False),
+
+    ("comp_index_active", "compdata", False),
+    ("comp_name_active", "compdata", False),
+    ("comp_structure", "compdata", False),
+    ("get_ideal_cp_correlation", "compdata", False),
+    ("set_ideal_cp_correlation", "compdata", False),
+
+    ("calccriticaltv", "critical", False),
+
+    ("get_energy_constants", "cubic_eos", False),
+    ("get_covolumes", "cubic_eos", False),
+
+    ("specificvolume", "eos", False),
+    ("zfac", "eos", False),
+    ("thermo", "eos", False),
+    ("entropy", "eos", False),
+    ("enthalpy", "eos", False),
+    ("compmoleweight", "eos", False),
+    ("moleweight", "eos", False),
+    ("getcriticalparam", "eos", False),
+    ("ideal_enthalpy_single", "eos", False),
+    ("ideal_entropy_single", "eos", False),
+
+    ("init_thermo", "eoslibinit", False),
+    ("init_cubic", "eoslibinit", False),
+    ("init_cubic_pseudo", "eoslibinit", False),
+    ("init_cpa", "eoslibinit", False),
+    ("init_pcsaft", "eoslibinit", False),
+    ("init_saftvrmie", "eoslibinit", False),
+    ("init_quantum_cubic", "eoslibinit", False),
+    ("init_tcpr", "eoslibinit", False),
+    ("init_quantum_saftvrmie", "eoslibinit", False),
+    ("init_extcsp", "eoslibinit", False),
+    ("init_lee_kesler", "eoslibinit", False),
+    ("init_multiparameter", "eoslibinit", False),
+    ("init_pets", "eoslibinit", False),
+    ("init_volume_translation", "eoslibinit", False),
+    ("redefine_critical_parameters", "eoslibinit", False),
+    ("init_lj", "eoslibinit", False),
+    ("init_ljs", "eoslibinit", False),
+    ("init_ideal_eos", "eoslibinit", False),
+
+    ("internal_energy_tv", "eostv", False),
+    ("entropy_tv", "eostv", False),
+    ("pressure", "eostv", False),
+    ("thermo_tv", "eostv", False),
+    ("enthalpy_tv", "eostv", False),
+    ("free_energy_tv", "eostv", False),
+    ("chemical_potential_tv", "eostv", False),
+    ("virial_coefficients", "eostv", False),
+    ("secondvirialcoeffmatrix", "eostv", False),
+    ("binarythirdvirialcoeffmatrix", "eostv", False),
+    ("entropy_tvp", "eostv", False),
+    ("thermo_tvp", "eostv", False),
+    ("enthalpy_tvp", "eostv", False),
+
+    ("fmt_energy_density", "fundamental_measure_theory", False),
+
+    ("calc_bmcsl_gij_fmt", "hardsphere_bmcsl", False),
+
+    ("set_standard_entropy", "ideal", False),
+    ("get_standard_entropy", "ideal", False),
+    ("set_enthalpy_of_formation", "ideal", False),
+    ("get_enthalpy_of_formation", "ideal", False),
+
+    ("isobar", "isolines", False),
+    ("isotherm", "isolines", False),
+    ("isenthalp", "isolines", False),
+    ("isentrope", "isolines", False),
+
+    ("map_jt_inversion", "joule_thompson_inversion", False),
+
+    ("ljs_bh_model_control", "lj_splined", False),
+    ("ljs_bh_get_pure_params", "lj_splined", False),
+    ("ljs_bh_set_pure_params", "lj_splined", False),
+    ("calc_ai_reduced_ljs_ex", "lj_splined", False),
+    ("ljs_bh_get_bh_diameter_div_sigma", "lj_splined", False),
+    ("calc_ljs_wca_ai_tr", "lj_splined", False),
+    ("ljs_uv_model_control", "lj_splined", False),
+    ("ljs_wca_model_control", "lj_splined", False),
+    ("ljs_wca_set_pure_params", "lj_splined", False),
+    ("ljs_wca_get_pure_params", "lj_splined", False),
+
+    ("solve_mu_t", "mut_solver", False),
+    ("solve_lnf_t", "mut_solver", False),
+    ("map_meta_isotherm", "mut_solver", False),
+
+    ("fres_multipol", "multipol", False),
+    ("multipol_model_control", "multipol", False),
+
+    ("lng_ii_pc_saft_tvn", "pc_saft_nonassoc", False),
+
+    ("setphtolerance", "ph_solver", False),
+    ("twophasephflash", "ph_solver", False),
+
+    ("twophasepsflash", "ps_solver", False),
+
+    ("get_saftvrmie_eps_kij", "saftvrmie_containers", False),
+    ("set_saftvrmie_eps_kij", "saftvrmie_containers", False),
+    ("get_saftvrmie_sigma_lij", "saftvrmie_containers", False),
+    ("set_saftvrmie_sigma_lij", "saftvrmie_containers", False),
+    ("get_saftvrmie_lr_gammaij", "saftvrmie_containers", False),
+    ("set_saftvrmie_lr_gammaij", "saftvrmie_containers", False),
+    ("get_saftvrmie_pure_fluid_param", "saftvrmie_containers", False),
+    ("set_saftvrmie_pure_fluid_param", "saftvrmie_containers", False),
+    ("get_feynman_hibbs_order", "saftvrmie_containers", False),
+    ("set_saftvrmie_mass", "saftvrmie_containers", False),
+    ("set_saftvrmie_pure_fluid_deboer", "saftvrmie_containers", False),
+
+    ("model_control_hs", "saftvrmie_interface", False),
+    ("model_control_a1", "saftvrmie_interface", False),
+    ("model_control_a2", "saftvrmie_interface", False),
+    ("model_control_a3", "saftvrmie_interface", False),
+    ("model_control_chain", "saftvrmie_interface", False),
+    ("hard_sphere_reference", "saftvrmie_interface", False),
+    ("set_temperature_cache_flag", "saftvrmie_interface", False),
+    ("calc_saftvrmie_term", "saftvrmie_interface", False),
+
+
+    ("printbinarymixturereportsaft", "saft_interface", False),
+    ("print_cpa_report", "saft_interface", False),
+    ("cpa_get_kij", "saft_interface", False),
+    ("cpa_set_kij", "saft_interface", False),
+    ("cpa_set_pure_params", "saft_interface", False),
+    ("cpa_get_pure_params", "saft_interface", False),
+    ("pc_saft_get_kij", "saft_interface", False),
+    ("pc_saft_set_kij_asym", "saft_interface", False),
+    ("calc_saft_dispersion", "saft_interface", False),
+    ("calc_saft_chain", "saft_interface", False),
+    ("calc_hard_sphere_diameter", "saft_interface", False),
+    ("calc_hard_sphere_diameter_ij", "saft_interface", False),
+    ("pc_saft_get_pure_params", "saft_interface", False),
+    ("pc_saft_set_pure_params", "saft_interface", False),
+    ("de_broglie_wavelength", "saft_interface", False),
+    ("potential", "saft_interface", False),
+    ("adjust_mass_to_specified_de_boer_parameter", "saft_interface", False),
+    ("de_boer_parameter", "saft_interface", False),
+    ("calc_soft_repulsion", "saft_interface", False),
+    ("pets_get_pure_params", "saft_interface", False),
+    ("pets_set_pure_params", "saft_interface", False),
+    ("truncation_corrections", "saft_interface", False),
+    ("calc_saft_hard_sphere", "saft_interface", False),
+    ("test_fmt_compatibility", "saft_interface", False),
+    ("setcpaformulation", "saft_interface", False),
+    ("get_n_assoc_sites", "saft_interface", False),
+    ("calc_assoc_phi", "saft_interface", False),
+    ("sigma_ij", "saft_interface", False),
+    ("epsilon_ij", "saft_interface", False),
+    ("sigma_eff_ij", "saft_interface", False),
+    ("epsilon_eff_ij", "saft_interface", False),
+    ("alpha", "saft_interface", False),
+    ("getactiveassocparams", "saft_interface", False),
+    ("setactiveassocparams", "saft_interface", False),
+
+    ("map_stability_limit", "spinodal", False),
+    ("initial_stab_limit_point", "spinodal", False),
+    ("map_meta_isentrope", "spinodal", False),
+    ("tv_meta_ps", "spinodal", False),
+
+    ("safe_bubt", "saturation", False),
+    ("safe_bubp", "saturation", False),
+    ("safe_dewt", "saturation", False),
+    ("safe_dewp", "saturation", False),
+
+    ("envelopeplot", "saturation_curve", False),
+    ("envelope_isentrope_cross", "saturation_curve", False),
+    ("pure_fluid_saturation_wrapper", "saturation_curve", False),
+
+    ("locate_saturation_property", "saturation_point_locators", False),
+    ("property_index_from_string", "saturation_point_locators", False),
+    ("sat_points_based_on_prop", "saturation_point_locators", False),
+
+    ("solid_init", "solideos", False),
+    ("solid_specificvolume", "solideos", False),
+    ("solid_enthalpy", "solideos", False),
+    ("solid_entropy", "solideos", False),
+
+    ("solidenvelopeplot", "solid_saturation", False),
+    ("melting_pressure_correlation", "solid_saturation", False),
+    ("sublimation_pressure_correlation", "solid_saturation", False),
+
+    ("sound_velocity_2ph", "speed_of_sound", False),
+    ("speed_of_sound_tv", "speed_of_sound", False),
+
+    ("guessphase", "thermo_utils", False),
+
+    ("get_true", "thermopack_constants", False),
+
+    ("set_numerical_robustness_level", "thermopack_var", False),
+    ("get_numerical_robustness_level", "thermopack_var", False),
+    ("get_rgas", "thermopack_var", False),
+    ("set_tmin", "thermopack_var", False),
+    ("get_tmin", "thermopack_var", False),
+    ("set_tmax", "thermopack_var", False),
+    ("get_tmax", "thermopack_var", False),
+    ("set_pmin", "thermopack_var", False),
+    ("get_pmin", "thermopack_var", False),
+    ("set_pmax", "thermopack_var", False),
+    ("get_pmax", "thermopack_var", False),
+    ("add_eos", "thermopack_var", False),
+    ("delete_eos", "thermopack_var", False),
+    ("activate_model", "thermopack_var", False),
+    ("get_eos_identification", "thermopack_var", False),
+
+    ("twophasetpflash", "tp_solver", False),
+
+    ("twophasesvflash", "sv_solver", False),
+
+    ("twophaseuvflash", "uv_solver", False),
+)
 
 # FORTRAN compilers
 GNU = 1
@@ -362,11 +444,12 @@ MACOS = 2
 WINDOWS = 3
 
 if __name__ == "__main__":
-    # Write export files
-    write_def_file(GENERIC, LD_GCC, LINUX, "libthermopack_export.version")
-    write_def_file(GENERIC, LD_CLANG, MACOS, "libthermopack_export.symbols")
-    write_def_file(IFORT, LD_MSVC, WINDOWS, "thermopack.def")
+    # Write export files in place, so unchanged files keep their mtime
+    # and do not trigger a re-link
     thermopackroot = Path(__file__).parents[3]
-    move('libthermopack_export.version', thermopackroot/'libthermopack_export.version')
-    move('libthermopack_export.symbols', thermopackroot/'libthermopack_export.symbols')
-    move('thermopack.def', thermopackroot/'MSVStudio/thermopack.def')
+    write_all([(GENERIC, LD_GCC, LINUX,
+                thermopackroot/'libthermopack_export.version'),
+               (GENERIC, LD_CLANG, MACOS,
+                thermopackroot/'libthermopack_export.symbols'),
+               (IFORT, LD_MSVC, WINDOWS,
+                thermopackroot/'MSVStudio/thermopack.def')])